@@ -54,6 +54,16 @@ CI_PRESENCE_VARS: Final = (
     "TEAMCITY_VERSION",  # JetBrains TeamCity (https://www.jetbrains.com/help/teamcity/predefined-build-parameters.html)
 )
 
+#: Set views of the CI environment variables for fast intersection with `os.environ`
+_CI_BOOLEAN_VARS: Final = frozenset(CI_BOOLEAN_VARS)
+_CI_PRESENCE_VARS: Final = frozenset(CI_PRESENCE_VARS)
+
+
+#: cgroup file inspected for container runtime identifiers
+CGROUP_PATH: Final = Path("/proc/self/cgroup")
+
+#: PID of the init process, which is the main process in containers
+INIT_PID: Final = 1
 
 #: Container indicators for cgroup detection
 #: Reference: https://github.com/containers/podman/issues/3586,
@@ -103,14 +113,14 @@ def _in_ci_container() -> bool:
     """
     # Check documented container indicators
     container_checks = [
-        os.getpid() == 1,  # Process ID 1 (init process in containers)
+        os.getpid() == INIT_PID,  # Process ID 1 (init process in containers)
         bool(os.environ.get("CONTAINER")),  # Generic container environment variable
     ]
 
     # Check cgroup for container runtime identifiers (Docker official method)
     # Reference: https://docs.docker.com/engine/containers/runmetrics/#find-the-cgroup-for-a-given-container
     try:
-        with Path("/proc/self/cgroup").open() as f:
+        with CGROUP_PATH.open() as f:
             cgroup_content = f.read()
             # Container runtime signatures in cgroups (documented by Docker):
             # - "docker": Docker containers
@@ -142,19 +152,29 @@ def _is_ci() -> bool:
         bool: True if running in a detected CI environment
 
     """
+    # Only evaluate the CI variables that are actually set (and non-empty), unset
+    # variables are skipped instead of being read and coerced one by one
+    environ = os.environ
+    values = [
+        boolify(value)
+        for var in environ.keys() & _CI_BOOLEAN_VARS
+        if (value := environ[var])
+    ]
+
     # Check all boolean CI variables for explicit false values first
     # If any CI variable is explicitly set to false, respect that
-    for var_value in map(os.getenv, CI_BOOLEAN_VARS):
-        if var_value and not boolify(var_value):
-            return False
+    if not all(values):
+        return False
 
     # Check boolean CI environment variables for true values
-    for var_value in map(os.getenv, CI_BOOLEAN_VARS):
-        if boolify(var_value):
-            return True
+    if any(values):
+        return True
 
     # Check presence-based CI environment variables
-    return any(os.getenv(var) for var in CI_PRESENCE_VARS) or _in_ci_container()
+    return (
+        any(environ[var] for var in environ.keys() & _CI_PRESENCE_VARS)
+        or _in_ci_container()
+    )
 
 
 #: Whether the current environment is a CI environment
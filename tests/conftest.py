@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
+from shutil import rmtree
 from typing import TYPE_CHECKING
 
 import pytest
@@ -60,10 +61,18 @@ def sample_channel() -> Iterator[Channel]:
         yield Channel(url)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mutable_server() -> Iterator[tuple[Channel, list[MetadataType]]]:
+    """Serve the sample channel with the metadata queued in `mutable_metadatas`."""
     metadatas: list[MetadataType] = []
-    with serve_channel(SAMPLE_CHANNEL_DIR, iter(metadatas)) as url:
+
+    def consume() -> Iterator[MetadataType]:
+        # pop from the front so the queue can be emptied between tests,
+        # an empty queue is served as a missing endpoint
+        while True:
+            yield metadatas.pop(0) if metadatas else None
+
+    with serve_channel(SAMPLE_CHANNEL_DIR, consume()) as url:
         yield Channel(url), metadatas
 
 
@@ -75,18 +84,37 @@ def mutable_channel(mutable_server: tuple[Channel, list[MetadataType]]) -> Chann
 @pytest.fixture
 def mutable_metadatas(
     mutable_server: tuple[Channel, list[MetadataType]],
-) -> list[MetadataType]:
-    return mutable_server[1]
+) -> Iterator[list[MetadataType]]:
+    metadatas = mutable_server[1]
+    yield metadatas
+    # drop anything queued but not requested, the server is shared by all tests
+    metadatas.clear()
+
+
+@pytest.fixture(scope="session")
+def search_path_root(tmp_path_factory: TempPathFactory) -> Path:
+    """Root directory for the mocked search path, created once per session."""
+    tos_root = tmp_path_factory.mktemp("tos")
+    (tos_root / "system").mkdir()
+    (tos_root / "user").mkdir()
+    return tos_root
 
 
 @pytest.fixture
 def mock_search_path(
     monkeypatch: MonkeyPatch,
-    tmp_path_factory: TempPathFactory,
+    search_path_root: Path,
 ) -> tuple[Path, Path]:
-    tos_root = tmp_path_factory.mktemp("tos")
-    (system_tos_root := tos_root / "system").mkdir()
-    (user_tos_root := tos_root / "user").mkdir()
+    tos_root = search_path_root
+    system_tos_root = tos_root / "system"
+    user_tos_root = tos_root / "user"
+
+    # tests write metadata into the roots, empty them only if something was written
+    for root in (system_tos_root, user_tos_root):
+        if any(root.iterdir()):
+            rmtree(root)
+            root.mkdir()
+
     monkeypatch.setattr(
         path,
         "SEARCH_PATH",
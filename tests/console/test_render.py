@@ -31,6 +31,7 @@ from conda_anaconda_tos.path import SEARCH_PATH
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Any, Callable
 
     from conda.models.channel import Channel
     from pytest import CaptureFixture, MonkeyPatch
@@ -38,101 +39,67 @@ if TYPE_CHECKING:
     from conda_anaconda_tos.models import RemoteToSMetadata
 
 
-def test_render_view(
+@pytest.mark.parametrize(
+    "render_action,message,missing,expected_json,shows_text",
+    [
+        pytest.param(
+            render_view,
+            "viewing Terms of Service for {channel}:",
+            "no Terms of Service for {channel}",
+            {},
+            True,
+            id="view",
+        ),
+        pytest.param(
+            render_accept,
+            "accepted Terms of Service for {channel}",
+            "Terms of Service not found for {channel}",
+            {"tos_accepted": True},
+            False,
+            id="accept",
+        ),
+        pytest.param(
+            render_reject,
+            "rejected Terms of Service for {channel}",
+            "Terms of Service not found for {channel}",
+            {"tos_accepted": False},
+            False,
+            id="reject",
+        ),
+    ],
+)
+def test_render_action(
     capsys: CaptureFixture,
     tos_channel: Channel,
     sample_channel: Channel,
     tos_metadata: RemoteToSMetadata,
     tmp_path: Path,
+    render_action: Callable[..., int],
+    message: str,
+    missing: str,
+    expected_json: dict[str, Any],
+    shows_text: bool,
 ) -> None:
-    render_view(tos_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    tos_lines = out.splitlines()
-    assert tos_lines == [
-        f"viewing Terms of Service for {tos_channel}:",
-        *tos_metadata.text.splitlines(),
-    ]
-    # assert not err  # server log is output to stderr
-
-    render_view(tos_channel, tos_root=tmp_path, cache_timeout=None, json=True)
-    out, err = capsys.readouterr()
-    view_json = json.loads(out)
-    for tos in view_json.values():
-        assert tos["text"] == tos_metadata.text
-    # assert not err  # server log is output to stderr
-
-    render_view(sample_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    sample_lines = out.splitlines()
-    assert sample_lines == [f"no Terms of Service for {sample_channel}"]
-    # assert not err  # server log is output to stderr
-
-    render_view(tos_channel, sample_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    assert out.splitlines() == [*tos_lines, *sample_lines]
-    # assert not err  # server log is output to stderr
-
-
-def test_render_accept(
-    capsys: CaptureFixture,
-    tos_channel: Channel,
-    sample_channel: Channel,
-    tmp_path: Path,
-) -> None:
-    render_accept(tos_channel, tos_root=tmp_path, cache_timeout=None)
+    render_action(tos_channel, tos_root=tmp_path, cache_timeout=None, json=True)
     out, err = capsys.readouterr()
-    tos_lines = out.splitlines()
-    assert tos_lines == [f"accepted Terms of Service for {tos_channel}"]
-    # assert not err  # server log is output to stderr
-
-    render_accept(tos_channel, tos_root=tmp_path, cache_timeout=None, json=True)
-    out, err = capsys.readouterr()
-    accept_json = json.loads(out)
-    for tos in accept_json.values():
-        assert tos["tos_accepted"] is True
-    # assert not err  # server log is output to stderr
-
-    render_accept(sample_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    sample_lines = out.splitlines()
-    assert sample_lines == [f"Terms of Service not found for {sample_channel}"]
-    # assert not err  # server log is output to stderr
-
-    render_accept(tos_channel, sample_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    assert out.splitlines() == [*tos_lines, *sample_lines]
-    # assert not err  # server log is output to stderr
-
-
-def test_render_reject(
-    capsys: CaptureFixture,
-    tos_channel: Channel,
-    sample_channel: Channel,
-    tmp_path: Path,
-) -> None:
-    render_reject(tos_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    tos_lines = out.splitlines()
-    assert tos_lines == [f"rejected Terms of Service for {tos_channel}"]
-    # assert not err  # server log is output to stderr
-
-    render_reject(tos_channel, tos_root=tmp_path, cache_timeout=None, json=True)
-    out, err = capsys.readouterr()
-    reject_json = json.loads(out)
-    for tos in reject_json.values():
-        assert tos["tos_accepted"] is False
-    # assert not err  # server log is output to stderr
-
-    render_reject(sample_channel, tos_root=tmp_path, cache_timeout=None)
-    out, err = capsys.readouterr()
-    sample_lines = out.splitlines()
-    assert sample_lines == [f"Terms of Service not found for {sample_channel}"]
-    # assert not err  # server log is output to stderr
-
-    render_reject(tos_channel, sample_channel, tos_root=tmp_path, cache_timeout=None)
+    for tos in json.loads(out).values():
+        for key, value in expected_json.items():
+            assert tos[key] is value
+        if shows_text:
+            assert tos["text"] == tos_metadata.text
+    assert not err
+
+    # render each channel separately and then both together, reading the output once
+    render_action(tos_channel, tos_root=tmp_path, cache_timeout=None)
+    render_action(sample_channel, tos_root=tmp_path, cache_timeout=None)
+    render_action(tos_channel, sample_channel, tos_root=tmp_path, cache_timeout=None)
     out, err = capsys.readouterr()
-    assert out.splitlines() == [*tos_lines, *sample_lines]
-    # assert not err  # server log is output to stderr
+    tos_out = message.format(channel=tos_channel) + "\n"
+    if shows_text:
+        tos_out += tos_metadata.text + "\n"
+    sample_out = missing.format(channel=sample_channel) + "\n"
+    assert out == tos_out + sample_out + tos_out + sample_out
+    assert not err
 
 
 @pytest.mark.parametrize("ci", [True, False])
@@ -394,28 +361,28 @@ def test_render_list(
     out, err = capsys.readouterr()
     assert str(tos_channel) in out
     assert TOS_OUTDATED not in out
-    # assert not err  # server log is output to stderr
+    assert not err
 
     accept_tos(tos_channel, tos_root=tmp_path, cache_timeout=None)
     render_list(tos_channel, tos_root=tmp_path, cache_timeout=None)
     out, err = capsys.readouterr()
     assert str(tos_channel) in out
     assert TOS_OUTDATED not in out
-    # assert not err  # server log is output to stderr
+    assert not err
 
     render_list(tos_channel, tos_root=tmp_path, cache_timeout=None, json=True)
     out, err = capsys.readouterr()
     list_json = json.loads(out)
     for tos in list_json.values():
         assert "path" in tos
-    # assert not err  # server log is output to stderr
+    assert not err
 
     tos_metadata.version += timedelta(days=1)
     render_list(tos_channel, tos_root=tmp_path, cache_timeout=None)
     out, err = capsys.readouterr()
     assert str(tos_channel) in out
     assert TOS_OUTDATED in out
-    # assert not err  # server log is output to stderr
+    assert not err
 
 
 def test_conda_tos_non_interactive_error_message_format() -> None:
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
 
 DATA_DIR = Path(__file__).parent / "data"
 SAMPLE_CHANNEL_DIR = DATA_DIR / "sample_channel"
+ENDPOINT_PATH = f"/{ENDPOINT}"
 
 
 def run_test_server(
@@ -51,18 +52,28 @@ def run_test_server(
         metadatas = metadata
 
     class CustomRequestHandler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, requires Content-Length
+        timeout = 5  # close idle keep-alive connections so shutdown isn't blocked
+        disable_nagle_algorithm = True  # headers & body are separate writes
+
         def do_GET(self: Self) -> None:
-            if (metadata := next(metadatas)) and self.path.startswith(f"/{ENDPOINT}"):
+            if (metadata := next(metadatas)) and self.path.startswith(ENDPOINT_PATH):
+                if isinstance(metadata, RemoteToSMetadata):
+                    body = metadata.model_dump_json().encode()
+                else:
+                    body = metadata.encode()
                 self.send_response(200)
                 self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
                 self.end_headers()
-                if isinstance(metadata, RemoteToSMetadata):
-                    self.wfile.write(metadata.model_dump_json().encode())
-                else:
-                    self.wfile.write(metadata.encode())
+                self.wfile.write(body)
             else:
                 super().do_GET()
 
+        def log_message(self: Self, format: str, *args: object) -> None:  # noqa: A002
+            # silence per-request logging to stderr
+            pass
+
     class CustomHTTPServer(http.server.ThreadingHTTPServer):
         daemon_threads = False  # These are per-request threads
         allow_reuse_address = True  # Good for tests
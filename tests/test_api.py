@@ -2,18 +2,21 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 import pytest
 from conda.auxlib.type_coercion import BOOLISH_FALSE, BOOLISH_TRUE
 from conda.base.context import context
 from conda.models.channel import Channel
 
+from conda_anaconda_tos import api
 from conda_anaconda_tos.api import (
     CI_BOOLEAN_VARS,
     CI_PRESENCE_VARS,
+    PARTIAL_CI_VARS,
+    _in_ci_container,
     _is_ci,
     get_channels,
     get_one_tos,
@@ -29,19 +32,31 @@ from conda_anaconda_tos.models import (
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Final
 
-    from pytest import MonkeyPatch
+    from pytest import FixtureRequest, MonkeyPatch
     from pytest_mock import MockerFixture
 
 
-def test_get_channels() -> None:
-    defaults = set(map(Channel, context.default_channels))
-    assert set(get_channels("defaults")) == defaults
+NOW: Final = datetime.now(tz=timezone.utc)
+DEFAULTS: Final = frozenset(map(Channel, context.default_channels))
+CONDA_FORGE: Final = frozenset({Channel("conda-forge")})
 
-    conda_forge = {Channel("conda-forge")}
-    assert set(get_channels("conda-forge")) == conda_forge
 
-    assert set(get_channels("defaults", "conda-forge")) == defaults | conda_forge
+@pytest.mark.parametrize(
+    "channels,expected",
+    [
+        pytest.param(("defaults",), DEFAULTS, id="defaults"),
+        pytest.param(("conda-forge",), CONDA_FORGE, id="conda-forge"),
+        pytest.param(
+            ("defaults", "conda-forge"),
+            DEFAULTS | CONDA_FORGE,
+            id="defaults & conda-forge",
+        ),
+    ],
+)
+def test_get_channels(channels: tuple[str, ...], expected: frozenset[Channel]) -> None:
+    assert frozenset(get_channels(*channels)) == expected
 
 
 @pytest.fixture(scope="session")
@@ -62,12 +77,13 @@ def local_metadata_pair(
 ) -> LocalPair:
     return LocalPair(
         metadata=LocalToSMetadata(
-            **remote_metadata_pair.metadata.model_dump(),
+            # iterating the model yields its fields without a serialization pass
+            **dict(remote_metadata_pair.metadata),
             base_url=sample_channel.base_url,
             tos_accepted=True,
-            acceptance_timestamp=datetime.now(tz=timezone.utc),
+            acceptance_timestamp=NOW,
         ),
-        path=uuid4().hex,
+        path="local.json",
     )
 
 
@@ -83,128 +99,180 @@ def old_metadata_pair(
             support="support.com",
             base_url=sample_channel.base_url,
             tos_accepted=True,
-            acceptance_timestamp=datetime.now(tz=timezone.utc),
+            acceptance_timestamp=NOW,
         ),
-        path=uuid4().hex,
+        path="old.json",
         remote=remote_metadata_pair.metadata,
     )
 
 
+def _mock_metadata(
+    mocker: MockerFixture,
+    getter: str,
+    channel: Channel,
+    metadata: RemoteToSMetadata | LocalPair | None,
+) -> None:
+    # mock the metadata getter (or missing metadata)
+    if metadata:
+        mocker.patch.object(api, getter, return_value=metadata)
+    else:
+        mocker.patch.object(api, getter, side_effect=CondaToSMissingError(channel))
+
+
+@pytest.mark.parametrize(
+    "remote,local,expected",
+    [
+        pytest.param(True, None, "remote_metadata_pair", id="remote only"),
+        pytest.param(
+            True,
+            "local_metadata_pair",
+            "local_metadata_pair",
+            id="local matches remote",
+        ),
+        pytest.param(
+            True,
+            "old_metadata_pair",
+            "old_metadata_pair",
+            id="local outdated",
+        ),
+        pytest.param(False, "old_metadata_pair", "old_metadata_pair", id="local only"),
+    ],
+)
 def test_get_one_tos(
     mocker: MockerFixture,
+    request: FixtureRequest,
     tmp_path: Path,
     sample_channel: Channel,
     remote_metadata_pair: RemotePair,
-    local_metadata_pair: LocalPair,
-    old_metadata_pair: LocalPair,
+    remote: bool,
+    local: str | None,
+    expected: str,
 ) -> None:
-    # mock remote metadata and no local metadata
-    mocker.patch(
-        "conda_anaconda_tos.api.get_remote_metadata",
-        return_value=remote_metadata_pair.metadata,
-    )
-    mocker.patch(
-        "conda_anaconda_tos.api.get_local_metadata",
-        side_effect=CondaToSMissingError(sample_channel),
-    )
-    assert remote_metadata_pair == get_one_tos(
+    _mock_metadata(
+        mocker,
+        "get_remote_metadata",
         sample_channel,
-        tos_root=tmp_path,
-        cache_timeout=None,
-    )
-
-    # mock local metadata version matches remote metadata version
-    mocker.patch(
-        "conda_anaconda_tos.api.get_local_metadata",
-        return_value=local_metadata_pair,
+        remote_metadata_pair.metadata if remote else None,
     )
-    assert local_metadata_pair == get_one_tos(
+    _mock_metadata(
+        mocker,
+        "get_local_metadata",
         sample_channel,
-        tos_root=tmp_path,
-        cache_timeout=None,
+        request.getfixturevalue(local) if local else None,
     )
 
-    # mock local metadata version is outdated
-    mocker.patch(
-        "conda_anaconda_tos.api.get_local_metadata",
-        return_value=old_metadata_pair,
-    )
-    assert old_metadata_pair == get_one_tos(
-        sample_channel,
-        tos_root=tmp_path,
-        cache_timeout=None,
-    )
-
-    # mock local metadata exists but remote metadata are missing
-    mocker.patch(
-        "conda_anaconda_tos.api.get_remote_metadata",
-        side_effect=CondaToSMissingError(sample_channel),
-    )
-    assert old_metadata_pair == get_one_tos(
+    assert request.getfixturevalue(expected) == get_one_tos(
         sample_channel,
         tos_root=tmp_path,
         cache_timeout=None,
     )
 
 
+@pytest.mark.parametrize(
+    "remote,local,expected",
+    [
+        pytest.param(False, "local_metadata_pair", None, id="no remote"),
+        pytest.param(
+            True,
+            "local_metadata_pair",
+            "local_metadata_pair",
+            id="local matches remote",
+        ),
+        pytest.param(
+            True,
+            "old_metadata_pair",
+            "old_metadata_pair",
+            id="local outdated",
+        ),
+    ],
+)
 def test_get_stored_tos(
     mocker: MockerFixture,
+    request: FixtureRequest,
     tmp_path: Path,
     sample_channel: Channel,
     remote_metadata_pair: RemotePair,
-    local_metadata_pair: LocalPair,
-    old_metadata_pair: LocalPair,
+    remote: bool,
+    local: str,
+    expected: str | None,
 ) -> None:
-    # mock no remote metadata
-    mocker.patch(
-        "conda_anaconda_tos.api.get_local_metadatas",
-        return_value=[(sample_channel, local_metadata_pair)],
+    _mock_metadata(
+        mocker,
+        "get_remote_metadata",
+        sample_channel,
+        remote_metadata_pair.metadata if remote else None,
     )
-    mocker.patch(
-        "conda_anaconda_tos.api.get_remote_metadata",
-        side_effect=CondaToSMissingError(sample_channel),
+    mocker.patch.object(
+        api,
+        "get_local_metadatas",
+        return_value=[(sample_channel, request.getfixturevalue(local))],
     )
-    assert not list(get_stored_tos(tos_root=tmp_path, cache_timeout=None))
 
-    # mock local metadata version matches remote metadata version
-    mocker.patch(
-        "conda_anaconda_tos.api.get_remote_metadata",
-        return_value=remote_metadata_pair.metadata,
-    )
     metadata_pairs = list(get_stored_tos(tos_root=tmp_path, cache_timeout=None))
-    assert metadata_pairs == [(sample_channel, local_metadata_pair)]
-
-    # mock local metadata version is outdated
-    mocker.patch(
-        "conda_anaconda_tos.api.get_local_metadatas",
-        return_value=[(sample_channel, old_metadata_pair)],
-    )
-    metadata_pairs = list(get_stored_tos(tos_root=tmp_path, cache_timeout=None))
-    assert metadata_pairs == [(sample_channel, old_metadata_pair)]
+    if expected:
+        assert metadata_pairs == [(sample_channel, request.getfixturevalue(expected))]
+    else:
+        assert not metadata_pairs
 
 
 def test_ci_detection_with_various_values(monkeypatch: MonkeyPatch) -> None:
     """Test CI detection with various truthy environment variable values."""
-    # Clear all CI-related environment variables first
+    # Clear all CI-related environment variables first, monkeypatch only restores the
+    # ones that were set, the variables set below are removed by their finally blocks
     for var in (*CI_BOOLEAN_VARS, *CI_PRESENCE_VARS):
         monkeypatch.delenv(var, raising=False)
 
     # truthy values
     for envvar in CI_BOOLEAN_VARS:
-        for truthy_value in (*BOOLISH_TRUE, "1"):
-            monkeypatch.setenv(envvar, truthy_value)
-            assert _is_ci(), f"CI should be detected for {envvar}={truthy_value}"
-        monkeypatch.delenv(envvar)
+        try:
+            for truthy_value in (*BOOLISH_TRUE, "1"):
+                os.environ[envvar] = truthy_value
+                assert _is_ci(), f"CI should be detected for {envvar}={truthy_value}"
+        finally:
+            os.environ.pop(envvar, None)
 
     # falsy values
     for envvar in CI_BOOLEAN_VARS:
-        for falsy_value in (*BOOLISH_FALSE, "0"):
-            monkeypatch.setenv(envvar, falsy_value)
-            assert not _is_ci(), f"CI should not be detected for {envvar}={falsy_value}"
-        monkeypatch.delenv(envvar)
+        try:
+            for falsy_value in (*BOOLISH_FALSE, "0"):
+                os.environ[envvar] = falsy_value
+                assert not _is_ci(), (
+                    f"CI should not be detected for {envvar}={falsy_value}"
+                )
+        finally:
+            os.environ.pop(envvar, None)
 
     # defined values
     for envvar in CI_PRESENCE_VARS:
-        monkeypatch.setenv(envvar, "value")
-        assert _is_ci(), f"CI should be detected for {envvar}=value"
-        monkeypatch.delenv(envvar)
+        try:
+            os.environ[envvar] = "value"
+            assert _is_ci(), f"CI should be detected for {envvar}=value"
+        finally:
+            os.environ.pop(envvar, None)
+
+
+def test_in_ci_container(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Test container CI detection against a fake cgroup file."""
+    for var in ("CONTAINER", *PARTIAL_CI_VARS):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(api, "CGROUP_PATH", cgroup := tmp_path / "cgroup")
+    # no process matches, otherwise running the tests as a container's init process
+    # would pass the container checks regardless of the cgroup file
+    monkeypatch.setattr(api, "INIT_PID", -1)
+
+    # missing cgroup file
+    assert not _in_ci_container()
+
+    # no container runtime in cgroup
+    cgroup.write_text("0::/user.slice\n")
+    monkeypatch.setenv("GITHUB_JOB", "test")
+    assert not _in_ci_container()
+
+    # container runtime in cgroup but no partial CI variables
+    cgroup.write_text("0::/docker/0123456789abcdef\n")
+    monkeypatch.delenv("GITHUB_JOB")
+    assert not _in_ci_container()
+
+    # container runtime in cgroup and partial CI variables
+    monkeypatch.setenv("GITHUB_JOB", "test")
+    assert _in_ci_container()
@@ -2,13 +2,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 from __future__ import annotations
 
-from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
-from conda.common.compat import on_win
 from conda.models.channel import Channel
 from pydantic import ValidationError
 
@@ -25,39 +23,52 @@ from conda_anaconda_tos.path import get_metadata_path
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from pytest import MonkeyPatch
+    from pytest import MonkeyPatch, TempPathFactory
+    from pytest_mock import MockerFixture
 
 
 CHANNEL = Channel("someplace")
+TOKEN = uuid4().hex  # generated once, shared by all tests
 TIMESTAMP1 = datetime(2024, 10, 1, tzinfo=timezone.utc)  # "version 1"
 NOW = datetime.now(tz=timezone.utc)
 REMOTE_METADATA = RemoteToSMetadata(
     version=TIMESTAMP1,
-    text=f"Terms of Service full text\n\n{uuid4().hex}",
+    text=f"Terms of Service full text\n\n{TOKEN}",
     support="support.com",
-    **{uuid4().hex: uuid4().hex},
+    **{f"key_{TOKEN}": f"value_{TOKEN}"},
 )
-LOCAL_METADATA = LocalToSMetadata(
-    **REMOTE_METADATA.model_dump(),
+# fields are already validated/typed, skip re-validating the test data
+LOCAL_METADATA = LocalToSMetadata.model_construct(
+    **dict(REMOTE_METADATA),
     tos_accepted=True,
     acceptance_timestamp=NOW,
     base_url=CHANNEL.base_url,
 )
 
 
+@pytest.fixture(scope="session")
+def written_metadata(tmp_path_factory: TempPathFactory) -> tuple[Path, LocalPair]:
+    """Accepted metadata written once for tests that only read it."""
+    tos_root = tmp_path_factory.mktemp("tos")
+    return tos_root, write_metadata(
+        tos_root,
+        CHANNEL,
+        REMOTE_METADATA,
+        tos_accepted=True,
+    )
+
+
 def _similar_metadata(
     metadata1: LocalToSMetadata | RemoteToSMetadata,
     metadata2: LocalToSMetadata | RemoteToSMetadata,
 ) -> bool:
-    metadata1_type = type(metadata1)
-    metadata2_type = type(metadata2)
-    return metadata1_type is metadata2_type and all(
-        getattr(metadata1, key) == getattr(metadata2, key)
-        for key in set(metadata1_type.model_fields) - {"acceptance_timestamp"}
+    exclude = {"acceptance_timestamp"}
+    return type(metadata1) is type(metadata2) and (
+        metadata1.model_dump(exclude=exclude) == metadata2.model_dump(exclude=exclude)
     )
 
 
-def test_write_metadata(tmp_path: Path) -> None:
+def test_write_metadata(mocker: MockerFixture, tmp_path: Path) -> None:
     path = get_metadata_path(tmp_path, CHANNEL, LOCAL_METADATA.version)
 
     # invalid input
@@ -87,16 +98,17 @@ def test_write_metadata(tmp_path: Path) -> None:
     assert _similar_metadata(metadata_pair.metadata, LOCAL_METADATA)
     assert metadata_pair.path == path
 
-    try:
-        path.chmod(0o000)
-        with pytest.raises(CondaToSPermissionError):
-            write_metadata(tmp_path, CHANNEL, LOCAL_METADATA)
-    finally:
-        # cleanup so tmp_path can be removed
-        path.chmod(0o700)
+    # unwritable path
+    mocker.patch("pathlib.Path.write_text", side_effect=PermissionError)
+    with pytest.raises(CondaToSPermissionError):
+        write_metadata(tmp_path, CHANNEL, LOCAL_METADATA)
 
 
-def test_read_metadata(tmp_path: Path) -> None:
+def test_read_metadata(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    written_metadata: tuple[Path, LocalPair],
+) -> None:
     path = get_metadata_path(tmp_path, CHANNEL, REMOTE_METADATA.version)
 
     # missing file
@@ -111,28 +123,27 @@ def test_read_metadata(tmp_path: Path) -> None:
     path.write_text("{}")
     assert not read_metadata(path)
 
-    try:
-        path.chmod(0o000)
-        with nullcontext() if on_win else pytest.raises(CondaToSPermissionError):
-            # Windows can only make the path read-only
-            read_metadata(path)
-    finally:
-        # cleanup so tmp_path can be removed
-        path.chmod(0o644)
-
     # valid metadata
-    write_metadata(tmp_path, CHANNEL, REMOTE_METADATA, tos_accepted=True)
-    assert read_metadata(path)
+    _, expected = written_metadata
+    assert read_metadata(expected.path) == expected
 
+    # unreadable path
+    mocker.patch("pathlib.Path.read_text", side_effect=PermissionError)
+    with pytest.raises(CondaToSPermissionError):
+        read_metadata(path)
 
-def test_get_local_metadata(tmp_path: Path) -> None:
+
+def test_get_local_metadata(
+    tmp_path: Path,
+    written_metadata: tuple[Path, LocalPair],
+) -> None:
     # missing metadata
     with pytest.raises(CondaToSMissingError):
         get_local_metadata(CHANNEL)
 
     # valid reads
-    expected = write_metadata(tmp_path, CHANNEL, REMOTE_METADATA, tos_accepted=True)
-    assert get_local_metadata(CHANNEL, extend_search_path=[tmp_path]) == expected
+    tos_root, expected = written_metadata
+    assert get_local_metadata(CHANNEL, extend_search_path=[tos_root]) == expected
 
     expected = write_metadata(tmp_path, CHANNEL, REMOTE_METADATA, tos_accepted=False)
     assert get_local_metadata(CHANNEL, extend_search_path=[tmp_path]) == expected
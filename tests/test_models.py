@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from contextlib import nullcontext
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import pytest
@@ -17,18 +18,26 @@ from conda_anaconda_tos.models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any, Final
 
 
 NOW: Final = datetime.now(tz=timezone.utc)
 TIMESTAMP1: Final = datetime(2024, 10, 1, tzinfo=timezone.utc)  # "version 1"
 TIMESTAMP2: Final = datetime(2024, 11, 1, tzinfo=timezone.utc)  # "version 2"
-REMOTE_METADATA = RemoteToSMetadata(
+#: Valid RemoteToSMetadata fields (tested in test_RemoteToSMetadata)
+REMOTE_KWARGS: Final[Mapping[str, Any]] = MappingProxyType(
+    {"version": 1, "text": "Terms of Service", "support": "support.com"}
+)
+
+
+#: Valid metadata, constructed without validation (covered by the tests below)
+REMOTE_METADATA: Final = RemoteToSMetadata.model_construct(
     version=TIMESTAMP2,
     text="Terms of Service",
     support="support.com",
 )
-LOCAL_METADATA = LocalToSMetadata(
+LOCAL_METADATA: Final = LocalToSMetadata.model_construct(
     version=TIMESTAMP1,
     text="Terms of Service",
     support="support.com",
@@ -38,70 +47,67 @@ LOCAL_METADATA = LocalToSMetadata(
 )
 
 
-def _filter_none_keys(kwargs: dict[str, Any]) -> dict[str, Any]:
-    return {key: value for key, value in kwargs.items() if value is not None}
-
-
 @pytest.mark.parametrize(
-    "version,text,support,raises",
+    "kwargs,raises",
     [
-        pytest.param(None, None, None, True, id="missing"),
-        pytest.param(1, None, None, True, id="only version"),
-        pytest.param(None, "Terms of Service", None, True, id="only text"),
-        pytest.param(None, None, "support.com", True, id="only text"),
-        pytest.param(object(), None, None, True, id="invalid version"),
-        pytest.param(None, object(), None, True, id="invalid text"),
-        pytest.param(None, None, object(), True, id="invalid text"),
-        pytest.param(1, "Terms of Service", "support.com", False, id="complete"),
+        pytest.param({}, True, id="missing"),
+        pytest.param({"version": 1}, True, id="only version"),
+        pytest.param({"text": "Terms of Service"}, True, id="only text"),
+        pytest.param({"support": "support.com"}, True, id="only support"),
+        pytest.param({"version": object()}, True, id="invalid version"),
+        pytest.param({"text": object()}, True, id="invalid text"),
+        pytest.param({"support": object()}, True, id="invalid support"),
+        pytest.param(REMOTE_KWARGS, False, id="complete"),
     ],
 )
-def test_RemoteToSMetadata(  # noqa: N802
-    version: int | None,
-    text: str | None,
-    support: str | None,
-    raises: bool,
-) -> None:
-    kwargs = {
-        "version": version,
-        "text": text,
-        "support": support,
-    }
+def test_RemoteToSMetadata(kwargs: Mapping[str, Any], raises: bool) -> None:  # noqa: N802
     with pytest.raises(ValidationError) if raises else nullcontext():
-        RemoteToSMetadata(**_filter_none_keys(kwargs))
+        RemoteToSMetadata(**kwargs)
 
 
 @pytest.mark.parametrize(
-    "base_url,tos_accepted,acceptance_timestamp,raises",
+    "kwargs,raises",
     [
-        pytest.param(None, None, None, True, id="missing"),
-        pytest.param("url", None, None, True, id="only base_url"),
-        pytest.param(None, True, None, True, id="only tos_accepted"),
-        pytest.param(None, None, NOW, True, id="only acceptance_timestamp"),
-        pytest.param(object(), None, None, True, id="invalid base_url"),
-        pytest.param(None, object(), None, True, id="invalid tos_accepted"),
-        pytest.param(None, None, object(), True, id="invalid acceptance_timestamp"),
-        pytest.param("url", True, None, True, id="base_url & tos_accepted"),
-        pytest.param(None, True, NOW, True, id="tos_accepted & acceptance_timestamp"),
-        pytest.param("url", None, NOW, True, id="base_url & acceptance_timestamp"),
-        pytest.param("url", True, NOW, False, id="complete"),
+        pytest.param({}, True, id="missing"),
+        pytest.param({"base_url": "url"}, True, id="only base_url"),
+        pytest.param({"tos_accepted": True}, True, id="only tos_accepted"),
+        pytest.param(
+            {"acceptance_timestamp": NOW},
+            True,
+            id="only acceptance_timestamp",
+        ),
+        pytest.param({"base_url": object()}, True, id="invalid base_url"),
+        pytest.param({"tos_accepted": object()}, True, id="invalid tos_accepted"),
+        pytest.param(
+            {"acceptance_timestamp": object()},
+            True,
+            id="invalid acceptance_timestamp",
+        ),
+        pytest.param(
+            {"base_url": "url", "tos_accepted": True},
+            True,
+            id="base_url & tos_accepted",
+        ),
+        pytest.param(
+            {"tos_accepted": True, "acceptance_timestamp": NOW},
+            True,
+            id="tos_accepted & acceptance_timestamp",
+        ),
+        pytest.param(
+            {"base_url": "url", "acceptance_timestamp": NOW},
+            True,
+            id="base_url & acceptance_timestamp",
+        ),
+        pytest.param(
+            {"base_url": "url", "tos_accepted": True, "acceptance_timestamp": NOW},
+            False,
+            id="complete",
+        ),
     ],
 )
-def test_LocalToSMetadata(  # noqa: N802
-    base_url: str | None,
-    tos_accepted: bool | None,
-    acceptance_timestamp: datetime | None,
-    raises: bool,
-) -> None:
-    kwargs = {
-        "version": 1,  # tested in test_RemoteToSMetadata
-        "text": "Terms of Service",  # tested in test_RemoteToSMetadata
-        "support": "support.com",  # tested in test_RemoteToSMetadata
-        "base_url": base_url,
-        "tos_accepted": tos_accepted,
-        "acceptance_timestamp": acceptance_timestamp,
-    }
+def test_LocalToSMetadata(kwargs: Mapping[str, Any], raises: bool) -> None:  # noqa: N802
     with pytest.raises(ValidationError) if raises else nullcontext():
-        LocalToSMetadata(**_filter_none_keys(kwargs))
+        LocalToSMetadata(**REMOTE_KWARGS, **kwargs)
 
 
 def test_ToSMetadata_ge() -> None:  # noqa: N802
@@ -114,41 +120,39 @@ def test_ToSMetadata_ge() -> None:  # noqa: N802
 
 
 @pytest.mark.parametrize(
-    "metadata,path,raises",
+    "kwargs,raises",
     [
-        pytest.param(None, None, True, id="missing"),
-        pytest.param(REMOTE_METADATA, None, False, id="only metadata"),
-        pytest.param(None, "path", True, id="only path"),
-        pytest.param(REMOTE_METADATA, "path", True, id="complete"),
+        pytest.param({}, True, id="missing"),
+        pytest.param({"metadata": REMOTE_METADATA}, False, id="only metadata"),
+        pytest.param({"path": "path"}, True, id="only path"),
+        pytest.param(
+            {"metadata": REMOTE_METADATA, "path": "path"},
+            True,
+            id="complete",
+        ),
     ],
 )
-def test_RemotePair(  # noqa: N802
-    metadata: RemoteToSMetadata | None,
-    path: str | None,
-    raises: bool,
-) -> None:
-    kwargs = {"metadata": metadata, "path": path}
+def test_RemotePair(kwargs: Mapping[str, Any], raises: bool) -> None:  # noqa: N802
     with pytest.raises(ValidationError) if raises else nullcontext():
-        RemotePair(**_filter_none_keys(kwargs))
+        RemotePair(**kwargs)
 
 
 @pytest.mark.parametrize(
-    "metadata,path,raises",
+    "kwargs,raises",
     [
-        pytest.param(None, None, True, id="missing"),
-        pytest.param(LOCAL_METADATA, None, True, id="only metadata"),
-        pytest.param(None, "path", True, id="only path"),
-        pytest.param(LOCAL_METADATA, "path", False, id="complete"),
+        pytest.param({}, True, id="missing"),
+        pytest.param({"metadata": LOCAL_METADATA}, True, id="only metadata"),
+        pytest.param({"path": "path"}, True, id="only path"),
+        pytest.param(
+            {"metadata": LOCAL_METADATA, "path": "path"},
+            False,
+            id="complete",
+        ),
     ],
 )
-def test_LocalPair(  # noqa: N802
-    metadata: RemoteToSMetadata | None,
-    path: str | None,
-    raises: bool,
-) -> None:
-    kwargs = {"metadata": metadata, "path": path}
+def test_LocalPair(kwargs: Mapping[str, Any], raises: bool) -> None:  # noqa: N802
     with pytest.raises(ValidationError) if raises else nullcontext():
-        LocalPair(**_filter_none_keys(kwargs))
+        LocalPair(**kwargs)
 
 
 def test_MetadataPair_lt() -> None:  # noqa: N802
@@ -28,13 +28,19 @@ from conda_anaconda_tos.path import (
 )
 
 if TYPE_CHECKING:
+    from typing import Final
+
     from conda.models.channel import Channel
     from pytest import MonkeyPatch
 
 
+NOW: Final = datetime.now(tz=timezone.utc)
+
+
 def test_hash_channel(sample_channel: Channel, tos_channel: Channel) -> None:
-    assert hash_channel(sample_channel) == hash_channel(sample_channel)
-    assert hash_channel(sample_channel) != hash_channel(tos_channel)
+    channel_hash = hash_channel(sample_channel)
+    assert hash_channel(sample_channel) == channel_hash
+    assert hash_channel(tos_channel) != channel_hash
 
     # invalid channel
     with pytest.raises(ValueError):
@@ -78,9 +84,8 @@ def test_get_tos_dir(tmp_path: Path, sample_channel: Channel) -> None:
 
 
 def test_get_metadata_path(tmp_path: Path, sample_channel: Channel) -> None:
-    timestamp = datetime.now(tz=timezone.utc)
-    expected = get_tos_dir(tmp_path, sample_channel) / f"{timestamp.timestamp()}.json"
-    assert get_metadata_path(tmp_path, sample_channel, timestamp) == expected
+    expected = get_tos_dir(tmp_path, sample_channel) / f"{NOW.timestamp()}.json"
+    assert get_metadata_path(tmp_path, sample_channel, NOW) == expected
 
 
 def test_get_all_channel_paths(
@@ -113,14 +118,15 @@ def test_get_channel_paths(
     mock_search_path: tuple[Path, Path],
 ) -> None:
     system_tos_root, user_tos_root = mock_search_path
+    channel_hash = hash_channel(sample_channel)
 
-    (channel1 := system_tos_root / hash_channel(sample_channel)).mkdir()
+    (channel1 := system_tos_root / channel_hash).mkdir()
     (json1 := channel1 / "1.json").touch()
 
-    (channel2 := user_tos_root / hash_channel(sample_channel)).mkdir()
+    (channel2 := user_tos_root / channel_hash).mkdir()
     (json2 := channel2 / "2.json").touch()
 
-    (channel3 := tmp_path / hash_channel(sample_channel)).mkdir()
+    (channel3 := tmp_path / channel_hash).mkdir()
     (json3 := channel3 / "3.json").touch()
 
     paths = get_channel_paths(sample_channel)
@@ -139,4 +145,4 @@ def test_get_cache_paths(mock_cache_dir: Path) -> None:
     (cache1 := mock_cache_dir / "cache1.cache").touch()
     (cache2 := mock_cache_dir / "cache2.cache").touch()
 
-    assert sorted(get_cache_paths()) == [cache1, cache2]
+    assert set(get_cache_paths()) == {cache1, cache2}
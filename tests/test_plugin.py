@@ -84,7 +84,7 @@ def test_request_headers_hook() -> None:
 def test_subcommand_tos(conda_cli: CondaCLIFixture) -> None:
     out, err, code = conda_cli("tos")
     assert out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -103,7 +103,7 @@ def test_subcommand_tos_view(
         *tos_metadata.text.splitlines(),
         f"no Terms of Service for {sample_channel}",
     ]
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -119,7 +119,7 @@ def test_subcommand_tos_accept(
         f"accepted Terms of Service for {tos_channel}",
         f"Terms of Service not found for {sample_channel}",
     ]
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -135,7 +135,7 @@ def test_subcommand_tos_reject(
         f"rejected Terms of Service for {tos_channel}",
         f"Terms of Service not found for {sample_channel}",
     ]
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -151,21 +151,21 @@ def test_subcommand_tos_list(
     out, err, code = conda_cli("tos")
     assert tos_channel.base_url in out
     assert sample_channel.base_url in out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
     accept_tos(tos_channel, tos_root=system_tos_root, cache_timeout=None)
     out, err, code = conda_cli("tos")
     assert tos_channel.base_url in out
     assert sample_channel.base_url in out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
     reject_tos(tos_channel, tos_root=user_tos_root, cache_timeout=None)
     out, err, code = conda_cli("tos")
     assert tos_channel.base_url in out
     assert sample_channel.base_url in out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -184,7 +184,7 @@ def test_subcommand_tos_interactive(
     out, err, code = conda_cli("tos", "interactive", f"--tos-root={user_tos_root}")
     assert tos_channel.base_url in out
     assert sample_channel.base_url not in out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -204,7 +204,7 @@ def test_subcommand_tos_interactive_offline(
 
     out, err, code = conda_cli("tos", "interactive", f"--tos-root={user_tos_root}")
     assert not out
-    # assert not err  # server log is output to stderr
+    assert not err
     assert not code
 
 
@@ -224,6 +224,7 @@ def test_request_headers(
     monkeypatch.setattr(plugin, "CI", ci)
     monkeypatch.setattr(plugin, "HOSTS", {urlparse(tos_channel.base_url).netloc})
     system_tos_root, user_tos_root = mock_search_path
+    prefix = f"{tos_channel}={int(tos_metadata.version.timestamp())}"
 
     url = f"{tos_channel}/terms.json"
 
@@ -243,16 +244,14 @@ def test_request_headers(
     accept_tos(tos_channel, tos_root=user_tos_root, cache_timeout=None)
     _cache_clear()
     request = get_session(url).get(url).request
-    value = f"{tos_channel}={int(tos_metadata.version.timestamp())}=accepted="
-    assert request.headers["Anaconda-ToS-Accept"].startswith(value)
+    assert request.headers["Anaconda-ToS-Accept"].startswith(f"{prefix}=accepted=")
     if ci:
         assert request.headers["Anaconda-ToS-Accept"].endswith(";CI=true")
 
     reject_tos(tos_channel, tos_root=user_tos_root, cache_timeout=None)
     _cache_clear()
     request = get_session(url).get(url).request
-    value = f"{tos_channel}={int(tos_metadata.version.timestamp())}=rejected="
-    assert request.headers["Anaconda-ToS-Accept"].startswith(value)
+    assert request.headers["Anaconda-ToS-Accept"].startswith(f"{prefix}=rejected=")
     if ci:
         assert request.headers["Anaconda-ToS-Accept"].endswith(";CI=true")
 
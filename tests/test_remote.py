@@ -8,8 +8,6 @@ from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
-from conda.common.compat import on_win
-from http_test_server import generate_metadata
 
 from conda_anaconda_tos.exceptions import (
     CondaToSInvalidError,
@@ -32,12 +30,13 @@ if TYPE_CHECKING:
     from http_test_server import MetadataType
     from pytest_mock import MockerFixture
 
+TOKEN = uuid4().hex  # generated once, shared by all tests
 TIMESTAMP1 = datetime(2024, 10, 1, tzinfo=timezone.utc)  # "version 1"
 REMOTE_METADATA = RemoteToSMetadata(
     version=TIMESTAMP1,
-    text=f"ToS full text\n\n{uuid4().hex}",
+    text=f"ToS full text\n\n{TOKEN}",
     support="support.com",
-    **{uuid4().hex: uuid4().hex},
+    **{f"key_{TOKEN}": f"value_{TOKEN}"},
 )
 
 
@@ -53,8 +52,9 @@ def test_get_endpoint(tos_channel: Channel, sample_channel: Channel) -> None:
     with pytest.raises(ValueError):
         get_endpoint("defaults")
 
+    # unknown channel, served locally instead of querying the real channel server
     with pytest.raises(CondaToSMissingError):
-        get_endpoint(uuid4().hex)
+        get_endpoint(f"{sample_channel.base_url}/{TOKEN}")
 
 
 def test_get_endpoint_mutable_server(
@@ -66,10 +66,10 @@ def test_get_endpoint_mutable_server(
         get_endpoint(mutable_channel)
 
     # second valid endpoint
-    mutable_metadatas.append(metadata := generate_metadata())
+    mutable_metadatas.append(REMOTE_METADATA)
     response = get_endpoint(mutable_channel)
     assert response.status_code == 200
-    assert RemoteToSMetadata(**response.json()) == metadata
+    assert RemoteToSMetadata(**response.json()) == REMOTE_METADATA
 
     # finally no endpoint again
     mutable_metadatas.append(None)
@@ -105,11 +105,7 @@ def test_get_cached_endpoint(sample_channel: Channel) -> None:
     assert get_cached_endpoint(sample_channel, cache_timeout=10) is None
 
 
-def test_write_cached_endpoint(
-    sample_channel: Channel,
-    mocker: MockerFixture,
-    tmp_path: Path,
-) -> None:
+def test_write_cached_endpoint(sample_channel: Channel, mocker: MockerFixture) -> None:
     path = get_cache_path(sample_channel)
     assert not path.exists()
 
@@ -124,15 +120,10 @@ def test_write_cached_endpoint(
     with pytest.raises(TypeError):
         write_cached_endpoint(sample_channel, object())  # type: ignore[arg-type]
 
-    (path := tmp_path / "cache").touch()
-    mocker.patch("conda_anaconda_tos.remote.get_cache_path", return_value=path)
-    try:
-        path.chmod(0o000)
-        with pytest.raises(CondaToSPermissionError):
-            write_cached_endpoint(sample_channel, REMOTE_METADATA)
-    finally:
-        # cleanup so tmp_path can be removed
-        path.chmod(0o644)
+    # unwritable path
+    mocker.patch("pathlib.Path.write_text", side_effect=PermissionError)
+    with pytest.raises(CondaToSPermissionError):
+        write_cached_endpoint(sample_channel, REMOTE_METADATA)
 
 
 def test_get_remote_metadata(
@@ -140,7 +131,7 @@ def test_get_remote_metadata(
     sample_channel: Channel,
     tos_metadata: RemoteToSMetadata,
     mocker: MockerFixture,
-    tmp_path: Path,
+    mock_cache_dir: Path,
 ) -> None:
     # get metadata of Terms of Service channel
     assert get_remote_metadata(tos_channel) == tos_metadata
@@ -154,8 +145,9 @@ def test_get_remote_metadata(
     with pytest.raises(ValueError):
         get_remote_metadata("defaults")
 
+    # unknown channel, served locally instead of querying the real channel server
     with pytest.raises(CondaToSMissingError):
-        get_remote_metadata(uuid4().hex)
+        get_remote_metadata(f"{sample_channel.base_url}/{TOKEN}")
 
     mocker.patch("conda_anaconda_tos.remote.get_endpoint", return_value=None)
     with pytest.raises(CondaToSInvalidError):
@@ -169,7 +161,7 @@ def test_get_remote_metadata(
     with pytest.raises(CondaToSInvalidError):
         get_remote_metadata(tos_channel)
 
-    cache = tmp_path / "cache"
+    cache = mock_cache_dir / "cache"
     mocker.patch("conda_anaconda_tos.remote.get_cached_endpoint", return_value=cache)
     with pytest.raises(CondaToSMissingError):
         get_remote_metadata(tos_channel)
@@ -178,14 +170,11 @@ def test_get_remote_metadata(
     with pytest.raises(CondaToSMissingError):
         get_remote_metadata(tos_channel)
 
-    try:
-        cache.chmod(0o000)
-        with pytest.raises(CondaToSMissingError if on_win else CondaToSPermissionError):
-            # Windows can only make the path read-only
-            get_remote_metadata(tos_channel)
-    finally:
-        # cleanup so tmp_path can be removed
-        cache.chmod(0o644)
+    # unreadable cache
+    read_text = mocker.patch("pathlib.Path.read_text", side_effect=PermissionError)
+    with pytest.raises(CondaToSPermissionError):
+        get_remote_metadata(tos_channel)
+    mocker.stop(read_text)
 
     cache.write_text("{}")
     with pytest.raises(CondaToSInvalidError):
@@ -212,9 +201,8 @@ def test_get_remote_metadata_mutable_server(
         get_remote_metadata(mutable_channel)
 
     # fourth valid endpoint
-    metadata = generate_metadata()
-    mutable_metadatas.append(metadata)
-    assert get_remote_metadata(mutable_channel) == metadata
+    mutable_metadatas.append(REMOTE_METADATA)
+    assert get_remote_metadata(mutable_channel) == REMOTE_METADATA
 
     # finally no endpoint again
     mutable_metadatas.append(None)